@@ -0,0 +1,29 @@
+"""
+Gunicorn settings for the Flask backends
+
+Usage: gunicorn -c gunicorn_conf.py app_enhanced:app   (or app:app)
+"""
+import os
+
+bind = os.getenv('BIND', '0.0.0.0:5000')
+
+# Threaded workers: each /chat spends most of its time waiting on Gemini, so
+# threads overlap those round trips while pandas work spreads across workers.
+# (gevent would need grpc's gevent shim for the Gemini SDK and does not mix
+# with the thread pool /chat uses for speculative handler runs.)
+# Kept to a small fixed count: every worker holds its own copy of the caches
+# and may start its own (bounded, spawned) sentiment process pool.
+worker_class = 'gthread'
+workers = int(os.getenv('WEB_CONCURRENCY', 2))
+threads = int(os.getenv('GUNICORN_THREADS', 8))
+
+# Gemini calls can take a few seconds; streamed answers hold the connection open
+timeout = 120
+keepalive = 5
+
+# Import the app (models, Parquet conversion, cached aggregates) once in the
+# master; forked workers then share those read-only pages copy-on-write.
+preload_app = True
+
+accesslog = '-'
+loglevel = os.getenv('LOG_LEVEL', 'info').lower()
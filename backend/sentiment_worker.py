@@ -0,0 +1,20 @@
+"""
+VADER scoring inside the sentiment process pool
+
+Kept out of the Flask app so spawned pool workers import only this module
+and vaderSentiment, not the app with its models and datasets.
+"""
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+_analyzer = None
+
+
+def init_worker():
+    """Give each pool worker its own VADER analyzer"""
+    global _analyzer
+    _analyzer = SentimentIntensityAnalyzer()
+
+
+def score_review(text):
+    """Score one review inside a pool worker"""
+    return _analyzer.polarity_scores(text)
@@ -41,5 +41,6 @@ echo "✅ All checks passed!"
 echo "🌐 Starting Flask server on http://localhost:5000"
 echo ""
 
-# Start Flask app
-python app.py
+# Start Flask app under Gunicorn (threaded workers, see gunicorn_conf.py);
+# run `python app.py` instead for the auto-reloading development server
+exec gunicorn -c gunicorn_conf.py app:app
@@ -16,6 +16,15 @@ try:
 except Exception:
     PROPHET_AVAILABLE = False
 
+# Parquet (optional) - column-projected reads of the sample data
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
 # VADER for reviews
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
@@ -23,17 +32,111 @@ DATA_DIR = Path(__file__).parent / "data"
 MODELS_DIR = Path(__file__).parent / "models"
 MODELS_DIR.mkdir(exist_ok=True)
 
+# Training-time category -> code maps, per model (read back by utils.py)
+CAT_MAPS_FILE = MODELS_DIR / "cat_maps.pkl"
+
+# Factorized columns of each model, passed to LightGBM as categorical features.
+# route_id (~1000 routes) is factorized too but stays an ordinary numeric
+# feature: as a categorical it grows the model ~30% for no RMSE gain.
+ORDERS_CATEGORICALS = ["city", "warehouse_id", "category", "courier_partner"]
+WAREHOUSE_CATEGORICALS = ["warehouse_id", "shifts"]
+TRANSPORT_CATEGORICALS = ["warehouse_id", "city", "courier_partner"]
+
+# One VADER analyzer (loads its lexicon once) for every reviews run
+sentiment_analyzer = SentimentIntensityAnalyzer()
+
+# Date columns of each sample dataset (same layout as the API's Parquet copies)
+SAMPLE_DATES = {
+    "orders_sample": ["order_date", "delivery_date"],
+    "seasonal_demand": ["date"],
+    "warehouse_ops_sample": ["date"],
+    "transportations_sample": [],
+    "customer_reviews_sample": ["review_date"],
+}
+
+# Low-cardinality keys stored dictionary-encoded in the Parquet copies
+CATEGORY_COLUMNS = ("category", "courier_partner", "warehouse_id", "city")
+
 
 def limit_rows(df, rows):
     return df.head(rows) if rows is not None else df
 
 
+def encode_categoricals(df, model, columns):
+    """Factorize columns of df in place (as int32 codes) and save their maps under model"""
+    cat_maps = joblib.load(CAT_MAPS_FILE) if CAT_MAPS_FILE.exists() else {}
+    cat_maps[model] = {}
+    for c in columns:
+        codes, uniques = pd.factorize(df[c].astype(str))
+        df[c] = codes.astype(np.int32)
+        cat_maps[model][c] = dict(zip(uniques, range(len(uniques))))
+    joblib.dump(cat_maps, CAT_MAPS_FILE)
+
+
+def parquet_path_for(name):
+    """Path of the training Parquet copy (kept apart from the apps' copies)"""
+    return DATA_DIR / f"{name}.train.parquet"
+
+
+def parquet_is_current(parquet_path, csv_path):
+    """True if the Parquet copy is newer than the CSV and has categorical keys"""
+    if not parquet_path.exists() or parquet_path.stat().st_mtime < csv_path.stat().st_mtime:
+        return False
+    schema = pq.read_schema(parquet_path)
+    return all(pa.types.is_dictionary(schema.field(c).type)
+               for c in CATEGORY_COLUMNS if c in schema.names)
+
+
+def ensure_parquet(name):
+    """Write the Parquet copy of a sample CSV if missing or stale; True if usable"""
+    csv_path = DATA_DIR / f"{name}.csv"
+    parquet_path = parquet_path_for(name)
+    if not PARQUET_AVAILABLE:
+        return False
+    if parquet_is_current(parquet_path, csv_path):
+        return True
+    df = pd.read_csv(csv_path, parse_dates=SAMPLE_DATES[name])
+    for c in CATEGORY_COLUMNS:
+        if c in df.columns:
+            df[c] = df[c].astype("category")
+    df.to_parquet(parquet_path, compression="zstd")
+    print(f"Wrote {parquet_path.name}")
+    return True
+
+
+def sample_columns(name):
+    """Column names of a sample dataset, without reading its rows"""
+    if ensure_parquet(name):
+        return pq.read_schema(parquet_path_for(name)).names
+    return list(pd.read_csv(DATA_DIR / f"{name}.csv", nrows=0).columns)
+
+
+def read_sample(name, columns):
+    """Read only the given columns of a sample dataset (Parquet copy preferred)"""
+    if ensure_parquet(name):
+        return pd.read_parquet(parquet_path_for(name), columns=columns)
+    return pd.read_csv(
+        DATA_DIR / f"{name}.csv",
+        usecols=columns,
+        parse_dates=[c for c in SAMPLE_DATES[name] if c in columns],
+    )
+
+
 # -------------------------------------------------------------
 # ORDERS MODEL — Train using Q1–Q3 only
 # -------------------------------------------------------------
 def train_orders(rows=None):
-    df = pd.read_csv(
-        DATA_DIR / "orders_sample.csv", parse_dates=["order_date", "delivery_date"]
+    df = read_sample(
+        "orders_sample",
+        [
+            "order_date",
+            "city",
+            "warehouse_id",
+            "category",
+            "order_value_inr",
+            "courier_partner",
+            "route_id",
+        ],
     )
     df = limit_rows(df, rows)
 
@@ -41,8 +144,7 @@ def train_orders(rows=None):
     df["order_dow"] = df["order_date"].dt.dayofweek
 
     # Encode categoricals
-    for c in ["city", "warehouse_id", "category", "courier_partner", "route_id"]:
-        df[c] = pd.factorize(df[c].astype(str))[0]
+    encode_categoricals(df, "orders", ORDERS_CATEGORICALS + ["route_id"])
 
     # Q1–Q3 filtering
     df = df[df["order_month"] <= 9].copy()
@@ -68,7 +170,7 @@ def train_orders(rows=None):
     )
 
     model = LGBMRegressor(n_estimators=200, random_state=42)
-    model.fit(X_train, y_train)
+    model.fit(X_train, y_train, categorical_feature=ORDERS_CATEGORICALS)
 
     rmse = np.sqrt(mean_squared_error(y_test, model.predict(X_test)))
     print(f"[ORDERS] Q1–Q3 RMSE: {rmse:.2f}")
@@ -81,7 +183,7 @@ def train_orders(rows=None):
 # SEASONAL MODEL — Train using Q1–Q3 only
 # -------------------------------------------------------------
 def train_seasonal(rows=None):
-    df = pd.read_csv(DATA_DIR / "seasonal_demand.csv", parse_dates=["date"])
+    df = read_sample("seasonal_demand", ["date", "demand_index"])
     df = limit_rows(df, rows)
 
     df["month"] = df["date"].dt.month
@@ -118,7 +220,17 @@ def train_seasonal(rows=None):
 # WAREHOUSE MODEL — Train using Q1–Q3 only
 # -------------------------------------------------------------
 def train_warehouse(rows=None):
-    df = pd.read_csv(DATA_DIR / "warehouse_ops_sample.csv", parse_dates=["date"])
+    df = read_sample(
+        "warehouse_ops_sample",
+        [
+            "date",
+            "warehouse_id",
+            "workforce_available",
+            "shifts",
+            "storage_cost_per_pallet_inr",
+            "avg_processing_time_hours",
+        ],
+    )
     df = limit_rows(df, rows)
 
     df["month"] = df["date"].dt.month
@@ -126,8 +238,7 @@ def train_warehouse(rows=None):
     df = df[df["month"] <= 9].copy()
     print(f"[WAREHOUSE] Training on {len(df)} rows from Q1–Q3")
 
-    for c in ["warehouse_id", "shifts"]:
-        df[c] = pd.factorize(df[c].astype(str))[0]
+    encode_categoricals(df, "warehouse", WAREHOUSE_CATEGORICALS)
 
     X = df[
         [
@@ -146,7 +257,7 @@ def train_warehouse(rows=None):
     )
 
     model = LGBMRegressor(n_estimators=200, random_state=42)
-    model.fit(X_train, y_train)
+    model.fit(X_train, y_train, categorical_feature=WAREHOUSE_CATEGORICALS)
 
     rmse = np.sqrt(mean_squared_error(y_test, model.predict(X_test)))
     print(f"[WAREHOUSE] Q1–Q3 RMSE: {rmse:.2f}")
@@ -159,7 +270,18 @@ def train_warehouse(rows=None):
 # TRANSPORT MODEL — Train using Q1–Q3 only
 # -------------------------------------------------------------
 def train_transport(rows=None):
-    df = pd.read_csv(DATA_DIR / "transportations_sample.csv")
+    columns = [
+        "warehouse_id",
+        "city",
+        "distance_km",
+        "fuel_cost_per_km_inr",
+        "courier_partner",
+        "courier_on_time_rate",
+        "estimated_transit_hours",
+    ]
+    if "date" in sample_columns("transportations_sample"):
+        columns.append("date")
+    df = read_sample("transportations_sample", columns)
     df = limit_rows(df, rows)
 
     # If dataset has NO date column, we cannot filter by month
@@ -173,8 +295,7 @@ def train_transport(rows=None):
             "[TRANSPORT] ⚠ No date column → cannot Q1–Q3 filter. Training on ALL rows."
         )
 
-    for c in ["warehouse_id", "city", "courier_partner"]:
-        df[c] = pd.factorize(df[c].astype(str))[0]
+    encode_categoricals(df, "transport", TRANSPORT_CATEGORICALS)
 
     X = df[
         [
@@ -194,7 +315,7 @@ def train_transport(rows=None):
     )
 
     model = LGBMRegressor(n_estimators=200, random_state=42)
-    model.fit(X_train, y_train)
+    model.fit(X_train, y_train, categorical_feature=TRANSPORT_CATEGORICALS)
 
     rmse = np.sqrt(mean_squared_error(y_test, model.predict(X_test)))
     print(f"[TRANSPORT] Q1–Q3 RMSE: {rmse:.2f}")
@@ -207,17 +328,16 @@ def train_transport(rows=None):
 # REVIEWS MODEL — No Q1–Q3 filtering needed (sentiment is not seasonal)
 # -------------------------------------------------------------
 def train_reviews(rows=None):
-    df = pd.read_csv(
-        DATA_DIR / "customer_reviews_Sample.csv", parse_dates=["review_date"]
-    )
+    df = read_sample("customer_reviews_sample", ["review_date", "review_text"])
     df = limit_rows(df, rows)
 
-    analyzer = SentimentIntensityAnalyzer()
-    df["sentiment"] = (
-        df["review_text"]
-        .fillna("")
-        .apply(lambda t: analyzer.polarity_scores(str(t))["compound"])
+    # Review texts repeat heavily: score each distinct text once, then
+    # broadcast the compound scores back to the rows by factorized code
+    codes, uniques = pd.factorize(df["review_text"].fillna(""))
+    compound = np.array(
+        [sentiment_analyzer.polarity_scores(str(t))["compound"] for t in uniques]
     )
+    df["sentiment"] = compound[codes]
     agg = df.groupby("review_date")["sentiment"].mean().reset_index()
 
     joblib.dump(agg, MODELS_DIR / "model_reviews_agg.pkl")
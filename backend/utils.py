@@ -1,4 +1,5 @@
 # utils.py
+import threading
 import joblib
 import pandas as pd
 import numpy as np
@@ -6,18 +7,48 @@ from pathlib import Path
 
 MODELS_DIR = Path(__file__).parent / "models"
 
+# Models loaded so far, kept for the life of the process
+MODELS = {}
+MODELS_LOCK = threading.Lock()
+
 
 def load_model(name):
-    p = MODELS_DIR / name
-    if not p.exists():
-        raise FileNotFoundError(f"Model {name} not found at {p}")
-    return joblib.load(p)
+    if name not in MODELS:
+        with MODELS_LOCK:
+            if name not in MODELS:
+                p = MODELS_DIR / name
+                if not p.exists():
+                    raise FileNotFoundError(f"Model {name} not found at {p}")
+                MODELS[name] = joblib.load(p)
+    return MODELS[name]
+
+
+def encode_features(df_features, model):
+    """Encode raw categorical columns with the maps saved by train.py
+
+    Values unseen at training time become -1; columns that are already
+    numeric codes are left as they are.
+    """
+    try:
+        cat_maps = load_model("cat_maps.pkl").get(model, {})
+    except FileNotFoundError:
+        return df_features
+    raw = [
+        c for c in cat_maps
+        if c in df_features and not pd.api.types.is_numeric_dtype(df_features[c])
+    ]
+    if not raw:
+        return df_features
+    return df_features.assign(**{
+        c: df_features[c].astype(str).map(cat_maps[c]).fillna(-1).astype(int)
+        for c in raw
+    })
 
 
 # orders prediction wrapper
 def predict_orders_df(df_features):
     model = load_model("model_orders.pkl")
-    preds = model.predict(df_features)
+    preds = model.predict(encode_features(df_features, "orders"))
     return preds
 
 
@@ -47,13 +78,15 @@ def generate_stock_insights(predicted_vals, baseline_vals, surge_pct=0.0):
     baseline = np.array(baseline_vals) + 1e-6
     pred = np.array(predicted_vals) * (1 + surge_pct)
     pct_change = (pred - baseline) / baseline
-    # recommend: increase stock by pct_change * 100 (rounded)
-    recommendations = []
-    for i, change in enumerate(pct_change):
-        rec = {"index": i, "predicted_change_pct": float(change * 100)}
-        if change > 0.10:
-            rec["action"] = f"Increase stock by {round(change*100)}%"
-        else:
-            rec["action"] = "No urgent change"
-        recommendations.append(rec)
-    return recommendations
+    pct_points = pct_change * 100
+    # recommend: increase stock by pct_change * 100 (rounded); only the
+    # entries above the 10% bar need a formatted action
+    actions = np.full(len(pct_change), "No urgent change", dtype=object)
+    increase = pct_change > 0.10
+    actions[increase] = [
+        f"Increase stock by {pct}%" for pct in np.round(pct_points[increase]).astype(int)
+    ]
+    return [
+        {"index": i, "predicted_change_pct": change, "action": action}
+        for i, (change, action) in enumerate(zip(pct_points.tolist(), actions.tolist()))
+    ]